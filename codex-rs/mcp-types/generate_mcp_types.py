@@ -2,6 +2,7 @@
 # flake8: noqa: E501
 
 import argparse
+import functools
 import json
 import subprocess
 import sys
@@ -134,78 +135,71 @@ fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
     # No-op: list collected via define_any_of("ClientRequest").
 
     # Generate TryFrom impl string and append to out before writing to file.
-    try_from_impl_lines: list[str] = []
-    try_from_impl_lines.append("impl TryFrom<JSONRPCRequest> for ClientRequest {\n")
-    try_from_impl_lines.append("    type Error = serde_json::Error;\n")
-    try_from_impl_lines.append(
-        "    fn try_from(req: JSONRPCRequest) -> std::result::Result<Self, Self::Error> {\n"
-    )
-    try_from_impl_lines.append("        match req.method.as_str() {\n")
-
+    # One f-string per match arm rather than one append per emitted line.
+    try_from_arms: list[str] = []
     for req_name in CLIENT_REQUEST_TYPE_NAMES:
         defn = definitions[req_name]
         method_const = defn.get("properties", {}).get("method", {}).get("const", req_name)
         payload_type = f"<{req_name} as ModelContextProtocolRequest>::Params"
-        try_from_impl_lines.append(f'            "{method_const}" => {{\n')
-        try_from_impl_lines.append(
+        try_from_arms.append(
+            f'            "{method_const}" => {{\n'
             "                let params_json = req.params.unwrap_or(serde_json::Value::Null);\n"
-        )
-        try_from_impl_lines.append(
             f"                let params: {payload_type} = serde_json::from_value(params_json)?;\n"
+            f"                Ok(ClientRequest::{req_name}(params))\n"
+            "            },\n"
         )
-        try_from_impl_lines.append(f"                Ok(ClientRequest::{req_name}(params))\n")
-        try_from_impl_lines.append("            },\n")
 
-    try_from_impl_lines.append(
-        '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", req.method)))),\n'
+    out.append(
+        "impl TryFrom<JSONRPCRequest> for ClientRequest {\n"
+        "    type Error = serde_json::Error;\n"
+        "    fn try_from(req: JSONRPCRequest) -> std::result::Result<Self, Self::Error> {\n"
+        "        match req.method.as_str() {\n"
+        + "".join(try_from_arms)
+        + '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", req.method)))),\n'
+        "        }\n"
+        "    }\n"
+        "}\n\n"
     )
-    try_from_impl_lines.append("        }\n")
-    try_from_impl_lines.append("    }\n")
-    try_from_impl_lines.append("}\n\n")
-
-    out.extend(try_from_impl_lines)
 
     # Generate TryFrom for ServerNotification
-    notif_impl_lines: list[str] = []
-    notif_impl_lines.append("impl TryFrom<JSONRPCNotification> for ServerNotification {\n")
-    notif_impl_lines.append("    type Error = serde_json::Error;\n")
-    notif_impl_lines.append(
-        "    fn try_from(n: JSONRPCNotification) -> std::result::Result<Self, Self::Error> {\n"
-    )
-    notif_impl_lines.append("        match n.method.as_str() {\n")
-
+    notif_arms: list[str] = []
     for notif_name in SERVER_NOTIFICATION_TYPE_NAMES:
         n_def = definitions[notif_name]
         method_const = n_def.get("properties", {}).get("method", {}).get("const", notif_name)
         payload_type = f"<{notif_name} as ModelContextProtocolNotification>::Params"
-        notif_impl_lines.append(f'            "{method_const}" => {{\n')
         # params may be optional
-        notif_impl_lines.append(
+        notif_arms.append(
+            f'            "{method_const}" => {{\n'
             "                let params_json = n.params.unwrap_or(serde_json::Value::Null);\n"
-        )
-        notif_impl_lines.append(
             f"                let params: {payload_type} = serde_json::from_value(params_json)?;\n"
+            f"                Ok(ServerNotification::{notif_name}(params))\n"
+            "            },\n"
         )
-        notif_impl_lines.append(f"                Ok(ServerNotification::{notif_name}(params))\n")
-        notif_impl_lines.append("            },\n")
 
-    notif_impl_lines.append(
-        '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", n.method)))),\n'
+    out.append(
+        "impl TryFrom<JSONRPCNotification> for ServerNotification {\n"
+        "    type Error = serde_json::Error;\n"
+        "    fn try_from(n: JSONRPCNotification) -> std::result::Result<Self, Self::Error> {\n"
+        "        match n.method.as_str() {\n"
+        + "".join(notif_arms)
+        + '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", n.method)))),\n'
+        "        }\n"
+        "    }\n"
+        "}\n"
     )
-    notif_impl_lines.append("        }\n")
-    notif_impl_lines.append("    }\n")
-    notif_impl_lines.append("}\n")
-
-    out.extend(notif_impl_lines)
 
-    with open(lib_rs, "w", encoding="utf-8") as f:
-        for chunk in out:
-            f.write(chunk)
+    # Join once and write once instead of pushing each chunk through the
+    # text-IO encoder separately.
+    lib_rs.write_text("".join(out), encoding="utf-8")
 
     if fmt:
+        # Run rustfmt on the generated file directly (the same invocation
+        # run_check uses) instead of going through cargo fmt, which forks
+        # cargo just to rediscover the crate's single source file.
+        config_path = lib_rs.resolve().parent.parent.parent / "rustfmt.toml"
         subprocess.check_call(
-            ["cargo", "fmt", "--", "--config", "imports_granularity=Item"],
-            cwd=lib_rs.parent.parent,
+            ["rustfmt", "--config-path", str(config_path), str(lib_rs)],
+            cwd=lib_rs.parent,
             stderr=subprocess.DEVNULL,
         )
 
@@ -734,6 +728,7 @@ def rust_prop_name(name: str, is_optional: bool) -> RustProp:
     return RustProp(prop_name, serde_str, ts_str)
 
 
+@functools.lru_cache(maxsize=None)
 def to_snake_case(name: str) -> str | None:
     """Convert a camelCase or PascalCase name to snake_case."""
     snake_case = name[0].lower() + "".join("_" + c.lower() if c.isupper() else c for c in name[1:])
@@ -54,6 +54,9 @@ EXTRA_ROOT = Path(os.environ["USERPROFILE"]) / "WorkspaceRoot"  # additional wri
 
 ENV_BASE = {}  # extend if needed
 
+# Merged once; run_sbx only copies when a case needs per-case overrides.
+BASE_ENV = {**os.environ, **ENV_BASE}
+
 class CaseResult:
     def __init__(self, name: str, ok: bool, detail: str = ""):
         self.name, self.ok, self.detail = name, ok, detail
@@ -65,10 +68,7 @@ def run_sbx(
     env_extra: Optional[dict] = None,
     additional_root: Optional[Path] = None,
 ) -> Tuple[int, str, str]:
-    env = os.environ.copy()
-    env.update(ENV_BASE)
-    if env_extra:
-        env.update(env_extra)
+    env = {**BASE_ENV, **env_extra} if env_extra else BASE_ENV
     # Map policy to codex CLI flags
     # read-only => default; workspace-write => --full-auto
     if policy not in ("read-only", "workspace-write"):
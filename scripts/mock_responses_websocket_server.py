@@ -70,6 +70,26 @@ def _dump_json(payload: Any) -> str:
     return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
+# The scripted exchange is fixed, so serialize each event once at import time
+# instead of on every connection.
+REQ1_EVENTS: tuple[str, ...] = tuple(
+    _dump_json(ev)
+    for ev in (
+        _event_response_created("resp-1"),
+        _event_function_call(CALL_ID, FUNCTION_NAME, FUNCTION_ARGS_JSON),
+        _event_response_done(),
+    )
+)
+REQ2_EVENTS: tuple[str, ...] = tuple(
+    _dump_json(ev)
+    for ev in (
+        _event_response_created("resp-2"),
+        _event_assistant_message("msg-1", ASSISTANT_TEXT),
+        _event_response_completed("resp-2"),
+    )
+)
+
+
 def _print_request(prefix: str, payload: Any) -> None:
     pretty = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
     sys.stdout.write(f"{prefix} {_utc_iso()}\n{pretty}\n")
@@ -97,29 +117,24 @@ async def _handle_connection(
         return
 
     async def recv_json(label: str) -> Any:
-        msg = await websocket.recv()
-        if isinstance(msg, bytes):
-            payload = json.loads(msg.decode("utf-8"))
-        else:
-            payload = json.loads(msg)
+        # json.loads accepts bytes directly, so binary frames need no explicit decode.
+        payload = json.loads(await websocket.recv())
         _print_request(f"[{label}] recv", payload)
         return payload
 
-    async def send_event(ev: dict[str, Any]) -> None:
-        sys.stdout.write(f"[conn] {_utc_iso()} send {_dump_json(ev)}\n")
-        await websocket.send(_dump_json(ev))
+    async def send_event(payload: str) -> None:
+        sys.stdout.write(f"[conn] {_utc_iso()} send {payload}\n")
+        await websocket.send(payload)
 
     # Request 1: provoke a function call (mirrors `codex-rs/core/tests/suite/agent_websocket.rs`).
     await recv_json("req1")
-    await send_event(_event_response_created("resp-1"))
-    await send_event(_event_function_call(CALL_ID, FUNCTION_NAME, FUNCTION_ARGS_JSON))
-    await send_event(_event_response_done())
+    for payload in REQ1_EVENTS:
+        await send_event(payload)
 
     # Request 2: expect appended tool output; send final assistant message.
     await recv_json("req2")
-    await send_event(_event_response_created("resp-2"))
-    await send_event(_event_assistant_message("msg-1", ASSISTANT_TEXT))
-    await send_event(_event_response_completed("resp-2"))
+    for payload in REQ2_EVENTS:
+        await send_event(payload)
 
     sys.stdout.write(f"[conn] {_utc_iso()} closing\n")
     sys.stdout.flush()
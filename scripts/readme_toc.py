@@ -18,6 +18,10 @@ from typing import List
 BEGIN_TOC: str = "<!-- Begin ToC -->"
 END_TOC: str = "<!-- End ToC -->"
 
+# Compiled once at module scope; both run against every heading/line.
+HEADING_RE = re.compile(r"^(#{2,6})\s+(.*)$")
+SLUG_PUNCTUATION_RE = re.compile(r"[^0-9a-z\s-]")
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -47,7 +51,7 @@ def generate_toc_lines(content: str) -> List[str]:
             continue
         if in_code:
             continue
-        m = re.match(r"^(#{2,6})\s+(.*)$", line)
+        m = HEADING_RE.match(line)
         if not m:
             continue
         level = len(m.group(1))
@@ -62,7 +66,7 @@ def generate_toc_lines(content: str) -> List[str]:
         slug = slug.replace("\u00a0", " ")
         slug = slug.replace("\u2011", "-").replace("\u2013", "-").replace("\u2014", "-")
         # drop other punctuation
-        slug = re.sub(r"[^0-9a-z\s-]", "", slug)
+        slug = SLUG_PUNCTUATION_RE.sub("", slug)
         slug = slug.strip().replace(" ", "-")
         toc.append(f"{indent}- [{text}](#{slug})")
     return toc
@@ -74,11 +78,17 @@ def check_or_fix(readme_path: Path, fix: bool) -> int:
         return 1
     content = readme_path.read_text(encoding="utf-8")
     lines = content.splitlines()
-    # locate ToC markers
-    try:
-        begin_idx = next(i for i, l in enumerate(lines) if l.strip() == BEGIN_TOC)
-        end_idx = next(i for i, l in enumerate(lines) if l.strip() == END_TOC)
-    except StopIteration:
+    # locate ToC markers (first occurrence of each, found in one pass)
+    begin_idx = end_idx = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if begin_idx is None and stripped == BEGIN_TOC:
+            begin_idx = i
+        elif end_idx is None and stripped == END_TOC:
+            end_idx = i
+        if begin_idx is not None and end_idx is not None:
+            break
+    if begin_idx is None or end_idx is None:
         # No ToC markers found; treat as a no-op so repos without a ToC don't fail CI
         print(
             f"Note: Skipping ToC check; no markers found in {readme_path}.",